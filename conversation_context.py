@@ -1,5 +1,6 @@
 import json
 from logger import Logger
+from utils import load_json_config
 
 
 class ContextManager:
@@ -8,20 +9,19 @@ class ContextManager:
 
     def load_context(self, config_file_path):
         try:
-            with open(config_file_path, 'r') as json_file:
-                config = json.load(json_file)
+            config = load_json_config(config_file_path)
 
-                # Navigate to the conversation context section
-                conversation_context = config.get("conversation", {}).get("conversation_context", [])
+            # Navigate to the conversation context section
+            conversation_context = config.get("conversation", {}).get("conversation_context", [])
 
-                if conversation_context:
-                    Logger.print_info(f"Loaded {len(conversation_context)} lines of conversation context from config.")
-                    for line in conversation_context:
-                        Logger.print_info(f"Context: {line}")
-                else:
-                    Logger.print_info("No conversation context found in config file.")
+            if conversation_context:
+                Logger.print_info(f"Loaded {len(conversation_context)} lines of conversation context from config.")
+                for line in conversation_context:
+                    Logger.print_info(f"Context: {line}")
+            else:
+                Logger.print_info("No conversation context found in config file.")
 
-                return conversation_context
+            return conversation_context
 
         except FileNotFoundError:
             Logger.print_error(f"Context config file not found at: {config_file_path}")
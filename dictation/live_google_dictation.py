@@ -1,8 +1,11 @@
 import pyaudio
+import numpy as np
 import keyboard  # Import keyboard to detect space bar press
 from google.cloud import speech_v1p1beta1 as speech
 from logger import Logger
-from threading import Timer
+from threading import Event
+from collections import deque
+from itertools import chain
 import time
 import socket
 from session_logger import SessionEvent
@@ -14,39 +17,133 @@ class LiveGoogleDictation(Dictation):
     COUNTER = 0
     MAX_RETRIES = 5  # Number of retry attempts in case of a broken pipe
     RETRY_DELAY = 2  # Seconds to wait before retrying
+    SAMPLE_RATE = 16000
+    FRAMES_PER_CHUNK = 1600  # 100ms of audio per recognizer request
+    AUDIO_BUFFER_CHUNKS = 40  # 4 seconds of audio; the oldest chunks are dropped if the recognizer falls further behind
+    SPEECH_RMS_THRESHOLD = 500  # 16-bit sample RMS below which a chunk counts as silence
+    SPEECH_MEAN_SQUARE_THRESHOLD = SPEECH_RMS_THRESHOLD ** 2  # Same threshold without the square root
+    SPEECH_HANGOVER_CHUNKS = 15  # 1.5 seconds of silence still sent after speech so the recognizer can finalize
+    SPEECH_PREROLL_CHUNKS = 3  # 0.3 seconds of silence held back and sent ahead of speech so word onsets aren't clipped
+    EARLY_FINAL_REPEATS = 3  # Identical interim results ending a sentence that are treated as the end of the turn
+    shared_client = None  # One SpeechClient (and gRPC channel) per process, created on first use
 
     def __init__(self):
         try:
             self.session_logger = None
             self.listening = True
-            self.client = speech.SpeechClient()
+            self.client = self.get_speech_client()
+            self.audio_buffer = deque(maxlen=self.AUDIO_BUFFER_CHUNKS)
+            self.audio_available = Event()
+            self.energy_buffer = np.empty(self.FRAMES_PER_CHUNK, dtype=np.int64)  # is_speech widens each chunk into this
+            self.done_speaking_deadline = None  # time.monotonic() at which the turn ends unless more speech is recognized
+            # Capture in callback mode so PyAudio's own thread fills the buffer and a slow recognizer loop can't overflow the device
             self.audio_stream = pyaudio.PyAudio().open(
                 format=pyaudio.paInt16,
                 channels=1,
-                rate=16000,
+                rate=self.SAMPLE_RATE,
                 input=True,
-                frames_per_buffer=1024
+                frames_per_buffer=self.FRAMES_PER_CHUNK,
+                stream_callback=self.buffer_audio
             )
         except Exception as e:
             Logger.print_error(f"Error initializing LiveGoogleDictation: {e}")
             raise
 
+    @classmethod
+    def get_speech_client(cls):
+        """Return the process-wide SpeechClient so new instances reuse its already-open channel."""
+        if cls.shared_client is None:
+            cls.shared_client = speech.SpeechClient()
+        return cls.shared_client
+
     def get_config(self):
         return speech.StreamingRecognitionConfig(
             config=speech.RecognitionConfig(
                 encoding=speech.RecognitionConfig.AudioEncoding.LINEAR16,
-                sample_rate_hertz=16000,
+                sample_rate_hertz=self.SAMPLE_RATE,
                 language_code="en-US",
                 enable_automatic_punctuation=True,
-                use_enhanced=True
+                model="command_and_search"  # Tuned for short spoken turns; returns results sooner than the default model
             ),
             interim_results=True,
         )
 
+    def buffer_audio(self, in_data, frame_count, time_info, status):
+        """PyAudio stream callback: hand captured audio to the recognizer without blocking the audio thread."""
+        if self.listening:
+            self.audio_buffer.append(in_data)
+            self.audio_available.set()
+        return None, pyaudio.paContinue
+
+    def is_speech(self, chunk):
+        """Return True if a chunk of 16-bit PCM is loud enough to be worth sending to the recognizer."""
+        samples = np.frombuffer(chunk, dtype=np.int16)
+
+        # RMS never exceeds the peak, so a chunk whose every sample is within the threshold is silence without squaring anything
+        threshold = self.SPEECH_RMS_THRESHOLD
+        if samples.size == 0 or (samples.max() < threshold and samples.min() > -threshold):
+            return False
+
+        # rms >= T is sum(x^2) >= T^2 * n, which skips the sqrt and divide and stays exact in int64
+        if samples.size <= self.energy_buffer.size:
+            widened = self.energy_buffer[:samples.size]
+            widened[...] = samples
+        else:
+            widened = samples.astype(np.int64)
+        return int(np.dot(widened, widened)) >= self.SPEECH_MEAN_SQUARE_THRESHOLD * samples.size
+
     def generate_audio_chunks(self):
-        """Generator that yields audio chunks from the audio stream."""
+        """
+        Generator that yields the audio chunks worth transcribing.
+
+        Silence is only sent for SPEECH_HANGOVER_CHUNKS after speech; the rest is held back, apart from the
+        last SPEECH_PREROLL_CHUNKS, which are sent just ahead of the next speech. Nothing is yielded until
+        the first speech, which getDictatedInput relies on to delay opening the recognizer stream.
+
+        Once that stream is open, silence past the hangover arms the done-speaking deadline, so a noise that
+        never produces a final result ends the turn instead of leaving the stream idle until Google aborts it.
+        """
+        preroll = deque(maxlen=self.SPEECH_PREROLL_CHUNKS)
+        hangover_remaining = 0
+        heard_speech = False
+
+        # Bound once; this loop runs for every captured chunk
+        is_speech = self.is_speech
+        hangover_chunks = self.SPEECH_HANGOVER_CHUNKS
+
+        for chunk in self.read_audio_chunks():
+            if is_speech(chunk):
+                if preroll:
+                    # Send the held-back lead-in together with the first loud chunk as a single request
+                    chunk = b"".join((*preroll, chunk))
+                    preroll.clear()
+                hangover_remaining = hangover_chunks
+                heard_speech = True
+                self.done_speaking_deadline = None
+                yield chunk
+            elif hangover_remaining:
+                hangover_remaining -= 1
+                yield chunk
+            else:
+                preroll.append(chunk)
+                if heard_speech and self.done_speaking_deadline is None:
+                    # Nothing is being sent on the open stream; re-armed here whenever a late result clears it
+                    self.done_speaking_deadline = time.monotonic() + self.SILENCE_THRESHOLD
+
+    def read_audio_chunks(self):
+        """Generator that yields audio chunks as the stream callback buffers them."""
+        audio_buffer = self.audio_buffer
+        audio_available = self.audio_available
+
         while self.listening:
-            yield self.audio_stream.read(1024, exception_on_overflow=False)
+            # This loop wakes at least every 0.1s, so it doubles as the silence timer for transcribe_stream
+            if self.done_speaking_deadline is not None and time.monotonic() >= self.done_speaking_deadline:
+                self.done_speaking()
+                break
+            audio_available.clear()
+            while self.listening and audio_buffer:
+                yield audio_buffer.popleft()
+            audio_available.wait(timeout=0.1)
 
     def done_speaking(self):
         """Mark the dictation as complete."""
@@ -54,20 +151,27 @@ class LiveGoogleDictation(Dictation):
 
     def transcribe_stream(self, stream, interruptable=False):
         """Main transcription loop."""
-        done_speaking_timer = None
-        self.state = 'START'
-        finalized_transcript = ''
+        state = 'START'
+        finalized_parts = []
+        previous_input = None
+        repeat_count = 0
+        print_user_input = Logger.print_user_input  # Called for every interim result
 
         responses = self.stream_with_retries(stream)
 
         for response in responses:
-            if not response.results:
+            # Read fields from the raw protobuf; every attribute access on the proto-plus wrapper goes through its marshalling layer
+            results = type(response).pb(response).results
+            if not results:
                 continue
-            result = response.results[0]
-            if not result.alternatives:
+            result = results[0]
+            alternatives = result.alternatives
+            if not alternatives:
                 continue
 
-            current_input = result.alternatives[0].transcript.strip()
+            current_input = alternatives[0].transcript.strip()
+            repeat_count = repeat_count + 1 if current_input == previous_input else 1
+            previous_input = current_input
 
             # Check for space bar press if interruptable is True
             if interruptable and keyboard.is_pressed('space'):
@@ -75,26 +179,30 @@ class LiveGoogleDictation(Dictation):
                 self.done_speaking()
                 break  # Exit the transcription loop
 
-            if done_speaking_timer is not None:
-                done_speaking_timer.cancel()
-
-            is_final = result.is_final
+            self.done_speaking_deadline = None  # Any new result means the user may still be talking
 
-            if self.state == 'START':
-                Logger.print_user_input(f'\033[K{current_input}\r', end='', flush=True)
-                self.state = 'LISTENING'
+            if state == 'START':
+                print_user_input(f'\033[K{current_input}\r', end='', flush=True)
+                state = 'LISTENING'
 
-            elif is_final:
-                finalized_transcript += f"{current_input} "
-                Logger.print_user_input(f'\033[K{current_input}', flush=True)
-                self.state = 'START'
-                done_speaking_timer = Timer(self.SILENCE_THRESHOLD, self.done_speaking)
-                done_speaking_timer.start()
+            elif result.is_final:
+                finalized_parts.append(current_input)
+                print_user_input(f'\033[K{current_input}', flush=True)
+                state = 'START'
+                self.done_speaking_deadline = time.monotonic() + self.SILENCE_THRESHOLD
 
-            elif self.state == 'LISTENING':
-                Logger.print_user_input(f'\033[K{current_input}', end='\r', flush=True)
+            elif state == 'LISTENING':
+                if repeat_count >= self.EARLY_FINAL_REPEATS and current_input.endswith(('.', '!', '?')):
+                    # The recognizer keeps repeating a finished sentence, so take it as final rather than waiting on the server
+                    finalized_parts.append(current_input)
+                    print_user_input(f'\033[K{current_input}', flush=True)
+                    state = 'START'
+                    self.done_speaking()
+                    break
+                print_user_input(f'\033[K{current_input}', end='\r', flush=True)
 
-        return finalized_transcript
+        self.state = state
+        return " ".join(finalized_parts)
 
     def stream_with_retries(self, stream):
         """
@@ -145,6 +253,16 @@ class LiveGoogleDictation(Dictation):
         """
         Start the transcription process, re-using the stream_with_retries method.
         """
+        self.audio_buffer.clear()  # Don't transcribe anything left over from the previous turn
+        self.done_speaking_deadline = None
         self.listening = True
-        transcript = self.transcribe_stream(self.generate_audio_chunks(), interruptable)
+
+        # Only open the recognizer stream once the speech gate lets audio through. Google aborts a stream that
+        # receives no audio for ~10 seconds, so opening it up front would fail over and over in a quiet room.
+        audio_chunks = self.generate_audio_chunks()
+        first_chunk = next(audio_chunks, None)
+        if first_chunk is None:
+            return ""
+
+        transcript = self.transcribe_stream(chain((first_chunk,), audio_chunks), interruptable)
         return transcript
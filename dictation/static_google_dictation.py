@@ -6,18 +6,30 @@ from google.cloud import speech_v1p1beta1 as speech
 from threading import Timer
 
 class StaticGoogleDictation(Dictation):
+    def __init__(self):
+        self.session_logger = None
+        self.recognizer = sr.Recognizer()
+        self.energy_thresholds = {}  # device index -> calibrated recognizer energy threshold
+
     def getDictatedInput(self, device_index, interruptable=False):
         Logger.print_debug("Testing audio input access...")
-        recognizer = sr.Recognizer()
+        recognizer = self.recognizer
 
         with sr.Microphone(device_index=device_index) as source:
             Logger.print_info("Microphone detected.")
-            Logger.print_info("Calibrating microphone...")
-            recognizer.adjust_for_ambient_noise(source, duration=1)
+            if device_index in self.energy_thresholds:
+                # Reuse the last turn's threshold rather than spending a second of every turn recalibrating
+                recognizer.energy_threshold = self.energy_thresholds[device_index]
+            else:
+                Logger.print_info("Calibrating microphone...")
+                recognizer.adjust_for_ambient_noise(source, duration=1)
             Logger.print_info("Go!")
             audio = recognizer.listen(source, phrase_time_limit=50000)
             Logger.print_info("Finished listening.")
 
+            # listen() keeps adjusting the threshold to the room, so carry its latest value into the next turn
+            self.energy_thresholds[device_index] = recognizer.energy_threshold
+
             try:
                 text = recognizer.recognize_google(audio)
                 Logger.print_user_input("You: ", text)
@@ -1,9 +1,9 @@
 import time
+import re
 from query_dispatch import ChatGPTQueryDispatcher
 from parse_inputs import load_config, parse_tts_interface, parse_dictation_type
 from session_logger import CLISessionLogger, SessionEvent
 from audio_turn_indicator import UserTurnIndicator, AiTurnIndicator
-from ttv.ttv import text_to_video
 import sys
 import os
 import signal
@@ -12,13 +12,9 @@ from hotwords import HotwordManager
 from conversation_context import ContextManager
 from fetch_and_display_logs import display_logs
 import datetime
-from ttv.image_generation import generate_image, save_image_with_caption, generate_blank_image, save_image_without_caption, generate_image_for_sentence
-from ttv.audio_generation import generate_audio, get_audio_duration
-from ttv.video_generation import create_video_segment, create_still_video_with_fade
-from music_lib import MusicGenerator
-from ttv.story_processor import process_story
-from ttv.final_video_generation import assemble_final_video, concatenate_video_segments
-from utils import get_tempdir, setup_tmp_dir
+from utils import setup_tmp_dir
+
+GOODBYE_PATTERN = re.compile("goodbye", re.IGNORECASE)
 
 def get_config_path():
     """Get the path to the config directory relative to the project root."""
@@ -126,28 +122,35 @@ def ai_turn(prompt, query_dispatcher, AI_TURN_INDICATOR, args, hotword_manager,
 
     if hotword_detected:
         # Hotword detected, skip query dispatcher
-        response = hotword_phrase
+        response_chunks = [hotword_phrase]
     else:
-        response = query_dispatcher.sendQuery(prompt)
-
-    if AI_TURN_INDICATOR:
-        AI_TURN_INDICATOR.input_out()
+        # Stream the reply so speech can start on its first sentence instead of waiting for all of it
+        response_chunks = query_dispatcher.sendQueryStreaming(prompt)
 
-    if tts:
-        # Generate speech response
-        _, file_path = tts.convert_text_to_speech(response)
-        tts.play_speech_response(file_path, response)
-
-        # If this response is coming from a hotword, then we want to clear the screen shortly afterwards (scavenger hunt mode)
-        if hotword_detected:
-            clear_screen_after_hotword(tts)
+    try:
+        if tts:
+            # Speak the response, synthesizing upcoming sentences while earlier ones play.
+            # The turn indicator switches back as soon as the first sentence is ready, before GANGLIA speaks.
+            response = tts.stream_speech_chunks(response_chunks, on_playback_start=AI_TURN_INDICATOR.input_out if AI_TURN_INDICATOR else None)
+        else:
+            response = "".join(response_chunks)
+            if AI_TURN_INDICATOR:
+                AI_TURN_INDICATOR.input_out()
+    finally:
+        if not hotword_detected:
+            # If playback was stopped early, this lets the dispatcher record the partial reply
+            response_chunks.close()
+
+    # If this response is coming from a hotword, then we want to clear the screen shortly afterwards (scavenger hunt mode)
+    if tts and hotword_detected:
+        clear_screen_after_hotword(tts)
 
     if session_logger:
         # Log interaction
         session_logger.log_session_interaction(SessionEvent(prompt, response))
 
 def should_end_conversation(prompt):
-    return prompt and "goodbye" in prompt.strip().lower()
+    return bool(prompt) and GOODBYE_PATTERN.search(prompt) is not None
 
 def end_conversation(session_logger=None):
     Logger.print_info("Ending session with GANGLIA. Goodbye!")
@@ -192,6 +195,8 @@ def main():
         if not args.ttv_config:
             Logger.print_error("JSON input file is required for --text-to-video.")
             sys.exit(1)
+        # Imported here so conversation mode doesn't pay for loading the video pipeline (moviepy, whisper, etc.)
+        from ttv.ttv import text_to_video
         current_datetime = datetime.datetime.now().strftime("%Y-%m-%d-%H-%M-%S")
         output_path = f"/tmp/GANGLIA/ttv/final_output_{current_datetime}.mp4"
         tts_client = parse_tts_interface(args.tts_interface)
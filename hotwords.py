@@ -1,28 +1,30 @@
 import json
+import re
 from logger import Logger
+from utils import load_json_config
 
 
 class HotwordManager:
     def __init__(self, config_file_path):
         self.hotwords_config = self.load_config(config_file_path)
+        self.hotword_pattern, self.hotword_phrases = self.compile_hotword_pattern(self.hotwords_config)
 
     def load_config(self, config_file_path):
         try:
-            with open(config_file_path, 'r') as json_file:
-                config = json.load(json_file)
+            config = load_json_config(config_file_path)
 
-                # Navigate to the hotwords section
-                hotwords_config = config.get("conversation", {}).get("hotwords", {})
+            # Navigate to the hotwords section
+            hotwords_config = config.get("conversation", {}).get("hotwords", {})
 
-                # Ensure that all hotwords are stored as lowercase for case-insensitive matching
-                lowercase_hotwords = {hotword.lower(): phrase for hotword, phrase in hotwords_config.items()}
+            # Ensure that all hotwords are stored as lowercase for case-insensitive matching
+            lowercase_hotwords = {hotword.lower(): phrase for hotword, phrase in hotwords_config.items()}
 
-                Logger.print_info(f"Loaded {len(lowercase_hotwords)} hotword mappings from config file")
+            Logger.print_info(f"Loaded {len(lowercase_hotwords)} hotword mappings from config file")
 
-                for hotword in lowercase_hotwords:
-                    Logger.print_info(f"Loaded hotword: {hotword}")
+            for hotword in lowercase_hotwords:
+                Logger.print_info(f"Loaded hotword: {hotword}")
 
-                return lowercase_hotwords
+            return lowercase_hotwords
 
         except FileNotFoundError:
             Logger.print_error(f"Hotword config file not found at: {config_file_path}")
@@ -31,16 +33,28 @@ class HotwordManager:
             Logger.print_error(f"Failed to parse hotword config file: {e}")
             return {}  # Return an empty dictionary in case of JSON decoding error
 
-    def detect_hotwords(self, prompt):
-        prompt = prompt.lower()
+    @staticmethod
+    def compile_hotword_pattern(hotwords_config):
+        """
+        Compile all hotwords into a single case-insensitive alternation so a prompt is scanned once.
+
+        Each hotword gets its own group, and the returned list holds the phrase for each group in order. Matches
+        are looked up by group rather than by their lowercased text, which need not be a config key ("KİSS").
+        """
+        if not hotwords_config:
+            return None, []
 
-        hotword_detected = False
-        hotword_phrase = ""
+        # Longest hotwords first so that overlapping entries prefer the most specific match
+        hotwords = sorted(hotwords_config, key=len, reverse=True)
+        pattern = re.compile("|".join(f"({re.escape(hotword)})" for hotword in hotwords), re.IGNORECASE)
+        return pattern, [hotwords_config[hotword] for hotword in hotwords]
+
+    def detect_hotwords(self, prompt):
+        if self.hotword_pattern is None:
+            return False, ""
 
-        for hotword, phrase in self.hotwords_config.items():
-            if hotword in prompt:
-                hotword_detected = True
-                hotword_phrase = phrase
-                break
+        match = self.hotword_pattern.search(prompt)
+        if match is None:
+            return False, ""
 
-        return hotword_detected, hotword_phrase
+        return True, self.hotword_phrases[match.lastindex - 1]
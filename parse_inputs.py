@@ -53,23 +53,30 @@ def load_coqui_config():
         Logger.print_error(f"Error: {ve}", file=sys.stderr)
         sys.exit(1)
 
+TTS_INTERFACES = {
+    "google": GoogleTTS,
+}
+
+DICTATION_TYPES = {
+    "static_google": StaticGoogleDictation,
+    "live_google": LiveGoogleDictation,
+}
+
 def parse_tts_interface(tts_interface: str) -> TextToSpeech:
-    if tts_interface.lower() == "google":
-        return GoogleTTS()
-    else:
+    tts_class = TTS_INTERFACES.get(tts_interface.lower())
+    if tts_class is None:
         raise ValueError(
             "Invalid TTS interface provided. Available options: 'google'"
         )
+    return tts_class()
 
 def parse_dictation_type(dictation_type: str) -> Dictation:
-    if dictation_type.lower() == "static_google":
-        return StaticGoogleDictation()
-    elif dictation_type.lower() == "live_google":
-        return LiveGoogleDictation()
-    else:
+    dictation_class = DICTATION_TYPES.get(dictation_type.lower())
+    if dictation_class is None:
         raise ValueError(
-            "Invalid dictation type provided. Available options: 'static_google'"
+            "Invalid dictation type provided. Available options: 'static_google', 'live_google'"
         )
+    return dictation_class()
 
 def parse_args(args=None):
     parser = argparse.ArgumentParser(description="GANGLIA - AI Assistant")
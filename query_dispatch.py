@@ -1,15 +1,29 @@
 import os
+import hashlib
 from datetime import datetime
 from openai import OpenAI
 from logger import Logger
 from utils import get_tempdir
-from time import time
+from time import monotonic
+from functools import lru_cache
+from collections import OrderedDict
+
+@lru_cache(maxsize=1024)
+def count_message_tokens(content):
+    """Approximate a message's token count by its word count, memoized since history is recounted every query."""
+    return len(content.split())
 
 class ChatGPTQueryDispatcher:
+    CACHE_MAX_ENTRIES = 512  # Least recently used replies are evicted beyond this
+    CACHE_TTL_SECONDS = 3600  # Cached replies older than this are treated as misses
+    CACHE_CONTEXT_TURNS = 3  # User/assistant exchanges fingerprinted into the cache key
+    CACHE_MAX_HISTORY_MESSAGES = 2 * CACHE_CONTEXT_TURNS  # Longer conversations skip the cache; turns outside the fingerprint could change the answer
+
     def __init__(self, pre_prompt=None, config_file_path=None):
         self.client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
         self.config_file_path = config_file_path or os.path.join(os.path.dirname(__file__), 'config', 'ganglia_config.json')
         self.messages = []
+        self.response_cache = OrderedDict()  # cache key -> (reply, time cached)
         if pre_prompt:
             self.messages.append({"role": "system", "content": pre_prompt})
 
@@ -19,21 +33,82 @@ class ChatGPTQueryDispatcher:
             self.messages.append({"role": "system", "content": line})
 
     def sendQuery(self, current_input):
-        self.messages.append({"role": "user", "content": current_input})
-        start_time = time()
-
-        self.rotate_session_history()  # Ensure history stays under the max length
+        self.begin_query(current_input)
 
         Logger.print_debug("Sending query to AI server...")
+        start_time = monotonic()
 
         chat = self.client.chat.completions.create(
             model="gpt-4o-mini",
             messages=self.messages
         )
         reply = chat.choices[0].message.content
+        self.record_reply(reply, start_time)
+
+        return reply
+
+    def sendQueryStreaming(self, current_input):
+        """
+        Send a query and yield the reply text as it streams in.
+
+        The full reply is added to the history and raw output file once the stream is exhausted,
+        exactly as sendQuery does for a blocking request, and is also cached. Only this conversational
+        path uses the cache; sendQuery callers (TTV, lyrics) retry on bad replies and must reach the model.
+        If the caller closes the generator early, whatever arrived so far is still added to the history.
+        """
+        cache_key = self.get_cache_key(current_input)
+        self.begin_query(current_input)
+
+        cached_reply = self.get_cached_reply(cache_key)
+        if cached_reply is not None:
+            yield self.serve_cached_reply(cached_reply)
+            return
+
+        Logger.print_debug("Streaming query to AI server...")
+        start_time = monotonic()
+
+        stream = self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=self.messages,
+            stream=True
+        )
+
+        reply_parts = []
+        completed = False
+        try:
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    reply_parts.append(content)
+                    yield content
+            completed = True
+        finally:
+            # Runs even if the caller stops early (e.g. playback was interrupted) so the history never ends on an
+            # unanswered user turn; a partial reply is kept in the history but not cached
+            if not completed:
+                stream.close()  # Drop the HTTP response so the server stops generating tokens nobody will hear
+            self.record_reply("".join(reply_parts), start_time, cache_key if completed else None)
+
+    def begin_query(self, current_input):
+        """Add the user's input to the history."""
+        self.messages.append({"role": "user", "content": current_input})
+
+        self.rotate_session_history()  # Ensure history stays under the max length
+
+    def serve_cached_reply(self, cached_reply):
+        self.messages.append({"role": "assistant", "content": cached_reply})
+        Logger.print_info("AI response served from cache.")
+        return cached_reply
+
+    def record_reply(self, reply, start_time, cache_key=None):
+        """Add a reply to the history and raw output file, caching it unless cache_key is None."""
         self.messages.append({"role": "assistant", "content": reply})
+        if cache_key is not None:
+            self.cache_reply(cache_key, reply)
 
-        Logger.print_info(f"AI response received in {time() - start_time:.1f} seconds.")
+        Logger.print_info(f"AI response received in {monotonic() - start_time:.1f} seconds.")
 
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
         temp_dir = get_tempdir()
@@ -41,27 +116,64 @@ class ChatGPTQueryDispatcher:
         with open(os.path.join(temp_dir, f"chatgpt_output_{timestamp}_raw.txt"), "w") as file:
             file.write(reply)
 
+    def get_cache_key(self, current_input):
+        """
+        Build the response cache key for a query, or None if the conversation is too long to cache.
+
+        The key pairs the normalized input with a fingerprint of the system/context messages and the last
+        CACHE_CONTEXT_TURNS user/assistant exchanges, so the same words only reuse a reply when the
+        conversation leading up to them was the same.
+        """
+        system_messages = [message["content"] for message in self.messages if message["role"] == "system"]
+        conversation = [(message["role"], message["content"]) for message in self.messages if message["role"] != "system"]
+        if len(conversation) > self.CACHE_MAX_HISTORY_MESSAGES:
+            return None
+        last_turns = conversation[-2 * self.CACHE_CONTEXT_TURNS:]
+        context = repr((system_messages, last_turns))
+        context_hash = hashlib.blake2b(context.encode(), digest_size=8).hexdigest()
+        return context_hash, current_input.strip().lower()
+
+    def get_cached_reply(self, cache_key):
+        """Return the cached reply for a key, or None if it is missing or expired."""
+        if cache_key is None:
+            return None
+        entry = self.response_cache.get(cache_key)
+        if entry is None:
+            return None
+
+        reply, cached_at = entry
+        if monotonic() - cached_at > self.CACHE_TTL_SECONDS:
+            del self.response_cache[cache_key]
+            return None
+
+        self.response_cache.move_to_end(cache_key)
         return reply
 
+    def cache_reply(self, cache_key, reply):
+        self.response_cache[cache_key] = (reply, monotonic())
+        self.response_cache.move_to_end(cache_key)
+        if len(self.response_cache) > self.CACHE_MAX_ENTRIES:
+            self.response_cache.popitem(last=False)
+
     def rotate_session_history(self):
-        total_tokens = 0
-        for message in self.messages:
-            total_tokens += len(message["content"].split())
+        total_tokens = self.count_tokens()
 
         MAX_TOKENS = 4097
 
-        while total_tokens > MAX_TOKENS:
-            removed_message = self.messages.pop(0)
-            removed_length = len(removed_message["content"].split())
+        # Find how many of the oldest messages must go, then drop them in one slice instead of repeated pop(0)
+        removed_count = 0
+        while total_tokens > MAX_TOKENS and removed_count < len(self.messages):
+            removed_message = self.messages[removed_count]
+            removed_length = count_message_tokens(removed_message["content"])
             total_tokens -= removed_length
+            removed_count += 1
             Logger.print_debug(f"Conversation history getting long - dropping oldest content: {removed_message['content']} ({removed_length} tokens)")
 
+        del self.messages[:removed_count]
+
     def count_tokens(self):
         """Count total tokens in the message history."""
-        total_tokens = 0
-        for message in self.messages:
-            total_tokens += len(message["content"].split())
-        return total_tokens
+        return sum(count_message_tokens(message["content"]) for message in self.messages)
 
     def filter_content_for_dalle(self, content, max_attempts=3):
         """
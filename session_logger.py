@@ -1,7 +1,7 @@
 import json
 import os
 from pathlib import Path
-import threading
+from concurrent.futures import ThreadPoolExecutor
 from utils import get_tempdir
 import time
 from abc import ABC, abstractmethod
@@ -12,6 +12,8 @@ from logger import Logger
 from google.cloud import storage
 
 class SessionEvent:
+    __slots__ = ("user_input", "response_output", "timestamp")
+
     def __init__(self, user_input: str, response_output: str):
         self.user_input = user_input
         self.response_output = response_output
@@ -34,6 +36,8 @@ class SessionEvent:
         }
 
 class Session:
+    __slots__ = ("session_id", "timestamp", "conversation")
+
     def __init__(self, session_id: str, timestamp: str, conversation: List[SessionEvent]):
         self.session_id = session_id
         self.timestamp = timestamp
@@ -66,17 +70,25 @@ class CLISessionLogger:
         self.bucket_name = os.getenv('GCP_BUCKET_NAME')
         self.project_name = os.getenv('GCP_PROJECT_NAME')
         self.options = options  # Store the options structure
+        self.log_writer = ThreadPoolExecutor(max_workers=1)
 
     def log_session_interaction(self, session_event: SessionEvent):
         self.conversation.append(session_event)
-        self.write_to_disk()
 
-        if self.options.store_logs:
-            # Use a background thread to upload the log without blocking the main thread. If we lose a log line or two, it's not a big deal.
-            threading.Thread(target=self.store_in_cloud_background).start()
+        # Hand the disk write (and upload) to a single background worker so it stays off the conversation path.
+        # The worker runs saves in order, so an older snapshot never overwrites a newer one.
+        self.log_writer.submit(self.save_session, list(self.conversation))
+
+    def save_session(self, conversation):
+        try:
+            self.write_to_disk(conversation)
+            if self.options.store_logs:
+                self.store_in_cloud_background()
+        except Exception as e:
+            Logger.print_error(f"Error saving session log: {e}")
 
-    def write_to_disk(self):
-        session = Session(self.session_id, self.timestamp, self.conversation)
+    def write_to_disk(self, conversation=None):
+        session = Session(self.session_id, self.timestamp, self.conversation if conversation is None else conversation)
         json_data = json.dumps(session.to_dict(), indent=2)
 
         file_path = Path(self.file_name)  # Use pathlib.Path
@@ -92,6 +104,7 @@ class CLISessionLogger:
             Logger.print_error(f"Error uploading logs to cloud: {e}")
 
     def finalize_session(self):
+        self.log_writer.shutdown(wait=True)  # Let pending saves finish before the final write
         self.write_to_disk()
         if self.options.store_logs:  # Check the flag from the options
             self.store_in_cloud_background()
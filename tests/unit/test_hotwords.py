@@ -0,0 +1,47 @@
+import json
+import pytest
+from hotwords import HotwordManager
+
+
+@pytest.fixture
+def hotword_config_path(tmp_path):
+    config = {
+        "conversation": {
+            "hotwords": {
+                "abracadabra": "You just said the magic word!",
+                "Voldemort": "You dare utter the name that should not be spoken?",
+                "kiss": "Mwah!"
+            }
+        }
+    }
+    config_path = tmp_path / "ganglia_config.json"
+    config_path.write_text(json.dumps(config))
+    return str(config_path)
+
+
+def test_detect_hotwords_is_case_insensitive(hotword_config_path):
+    manager = HotwordManager(hotword_config_path)
+
+    assert manager.detect_hotwords("I think VOLDEMORT is back") == (True, "You dare utter the name that should not be spoken?")
+    assert manager.detect_hotwords("Abracadabra!") == (True, "You just said the magic word!")
+
+
+def test_detect_hotwords_matches_text_that_does_not_lowercase_to_the_hotword(hotword_config_path):
+    manager = HotwordManager(hotword_config_path)
+
+    # "İ".lower() is "i̇" and "ſ".lower() is "ſ", yet both match "i" and "s" case-insensitively
+    assert manager.detect_hotwords("KİSS me") == (True, "Mwah!")
+    assert manager.detect_hotwords("kiſs me") == (True, "Mwah!")
+
+
+def test_detect_hotwords_no_match(hotword_config_path):
+    manager = HotwordManager(hotword_config_path)
+
+    assert manager.detect_hotwords("Tell me a story") == (False, "")
+
+
+def test_detect_hotwords_missing_config(tmp_path):
+    manager = HotwordManager(str(tmp_path / "missing.json"))
+
+    assert manager.hotword_pattern is None
+    assert manager.detect_hotwords("abracadabra") == (False, "")
@@ -0,0 +1,174 @@
+import sys
+import types
+from collections import deque
+from threading import Event
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from google.cloud import speech_v1p1beta1 as speech
+
+try:
+    import pyaudio  # noqa: F401
+except ImportError:
+    # PyAudio needs the PortAudio system library; these tests never open a microphone
+    sys.modules["pyaudio"] = types.SimpleNamespace(paInt16=8, paContinue=0)
+
+from dictation.live_google_dictation import LiveGoogleDictation
+
+QUIET_LEVEL = 10
+LOUD_LEVEL = 2000
+
+
+def make_dictation():
+    """Build a LiveGoogleDictation without opening a microphone or a SpeechClient."""
+    dictation = LiveGoogleDictation.__new__(LiveGoogleDictation)
+    dictation.session_logger = None
+    dictation.listening = True
+    dictation.audio_buffer = deque(maxlen=LiveGoogleDictation.AUDIO_BUFFER_CHUNKS)
+    dictation.audio_available = Event()
+    dictation.energy_buffer = np.empty(LiveGoogleDictation.FRAMES_PER_CHUNK, dtype=np.int64)
+    dictation.done_speaking_deadline = None
+    return dictation
+
+
+def make_chunk(level):
+    return np.full(LiveGoogleDictation.FRAMES_PER_CHUNK, level, dtype=np.int16).tobytes()
+
+
+def test_speech_gate_sends_preroll_with_first_speech_then_hangover():
+    dictation = make_dictation()
+    quiet = [make_chunk(QUIET_LEVEL + i) for i in range(6)]
+    loud = make_chunk(LOUD_LEVEL)
+    trailing_silence = [make_chunk(QUIET_LEVEL)] * (LiveGoogleDictation.SPEECH_HANGOVER_CHUNKS + 5)
+    dictation.read_audio_chunks = lambda: iter(quiet + [loud, loud] + trailing_silence)
+
+    sent = list(dictation.generate_audio_chunks())
+
+    preroll = quiet[-LiveGoogleDictation.SPEECH_PREROLL_CHUNKS:]
+    assert sent[0] == b"".join(preroll + [loud])
+    assert sent[1] == loud
+    assert sent[2:] == trailing_silence[:LiveGoogleDictation.SPEECH_HANGOVER_CHUNKS]
+
+
+def test_speech_gate_arms_silence_deadline_once_hangover_runs_out():
+    dictation = make_dictation()
+    quiet = make_chunk(QUIET_LEVEL)
+    loud = make_chunk(LOUD_LEVEL)
+
+    dictation.read_audio_chunks = lambda: iter([quiet] * 200)
+    assert list(dictation.generate_audio_chunks()) == []
+    assert dictation.done_speaking_deadline is None  # Silence before the first speech never ends the turn
+
+    dictation.read_audio_chunks = lambda: iter([loud] + [quiet] * LiveGoogleDictation.SPEECH_HANGOVER_CHUNKS)
+    list(dictation.generate_audio_chunks())
+    assert dictation.done_speaking_deadline is None  # Still within the hangover
+
+    dictation.read_audio_chunks = lambda: iter([loud] + [quiet] * (LiveGoogleDictation.SPEECH_HANGOVER_CHUNKS + 1))
+    with patch('dictation.live_google_dictation.time.monotonic', return_value=100.0):
+        list(dictation.generate_audio_chunks())
+
+    # A noise with no final result still ends the turn well before the idle stream times out
+    assert dictation.done_speaking_deadline == 100.0 + LiveGoogleDictation.SILENCE_THRESHOLD
+
+
+def test_speech_gate_clears_silence_deadline_when_speech_resumes():
+    dictation = make_dictation()
+    dictation.done_speaking_deadline = 100.0
+    dictation.read_audio_chunks = lambda: iter([make_chunk(LOUD_LEVEL)])
+
+    list(dictation.generate_audio_chunks())
+
+    assert dictation.done_speaking_deadline is None
+
+
+def test_get_dictated_input_waits_for_speech_before_opening_stream():
+    dictation = make_dictation()
+    quiet = make_chunk(QUIET_LEVEL)
+    loud = make_chunk(LOUD_LEVEL)
+    dictation.read_audio_chunks = lambda: iter([quiet] * 200 + [loud])
+
+    with patch.object(LiveGoogleDictation, 'transcribe_stream', return_value="hello") as transcribe_stream:
+        assert dictation.getDictatedInput(device_index=None) == "hello"
+
+    sent = list(transcribe_stream.call_args.args[0])
+    assert sent == [b"".join([quiet] * LiveGoogleDictation.SPEECH_PREROLL_CHUNKS + [loud])]
+
+
+def test_get_dictated_input_skips_stream_when_no_speech_arrives():
+    dictation = make_dictation()
+    dictation.read_audio_chunks = lambda: iter([make_chunk(QUIET_LEVEL)] * 200)
+
+    with patch.object(LiveGoogleDictation, 'transcribe_stream') as transcribe_stream:
+        assert dictation.getDictatedInput(device_index=None) == ""
+
+    transcribe_stream.assert_not_called()
+
+
+def make_response(transcript, is_final=False):
+    return speech.StreamingRecognizeResponse(results=[
+        speech.StreamingRecognitionResult(
+            alternatives=[speech.SpeechRecognitionAlternative(transcript=transcript)],
+            is_final=is_final,
+        )
+    ])
+
+
+@pytest.mark.parametrize("punctuation", [".", "!", "?"])
+def test_transcribe_stream_ends_turn_on_repeated_finished_sentence(punctuation):
+    dictation = make_dictation()
+    sentence = f"Hello there{punctuation}"
+    responses = iter(
+        [make_response("Hello"), make_response("Hello there")]
+        + [make_response(sentence)] * LiveGoogleDictation.EARLY_FINAL_REPEATS
+        + [make_response("never reached")]
+    )
+
+    with patch.object(LiveGoogleDictation, 'stream_with_retries', return_value=responses):
+        transcript = dictation.transcribe_stream(iter([]))
+
+    assert transcript == sentence
+    assert dictation.listening is False
+    assert next(responses, None) is not None  # The turn ended without waiting for more results
+
+
+def test_transcribe_stream_keeps_listening_on_repeated_unfinished_sentence():
+    dictation = make_dictation()
+    responses = [make_response("Hello")] + [make_response("Hello there")] * (LiveGoogleDictation.EARLY_FINAL_REPEATS + 2)
+
+    with patch.object(LiveGoogleDictation, 'stream_with_retries', return_value=iter(responses)):
+        transcript = dictation.transcribe_stream(iter([]))
+
+    assert transcript == ""
+    assert dictation.listening is True
+
+
+def test_silence_deadline_after_final_result_ends_request_generator():
+    dictation = make_dictation()
+    responses = [make_response("Hello"), make_response("Hello there", is_final=True)]
+
+    with patch.object(LiveGoogleDictation, 'stream_with_retries', return_value=iter(responses)):
+        assert dictation.transcribe_stream(iter([])) == "Hello there"
+    assert dictation.done_speaking_deadline is not None
+
+    loud = make_chunk(LOUD_LEVEL)
+    dictation.audio_buffer.append(loud)
+    requests = dictation.read_audio_chunks()
+    assert next(requests) == loud  # Still before the deadline
+
+    with patch.object(LiveGoogleDictation, 'done_speaking', autospec=True, side_effect=LiveGoogleDictation.done_speaking) as done_speaking, \
+         patch('dictation.live_google_dictation.time.monotonic', return_value=dictation.done_speaking_deadline):
+        assert list(requests) == []
+
+    done_speaking.assert_called_once_with(dictation)
+    assert dictation.listening is False
+
+
+def test_new_result_after_final_clears_silence_deadline():
+    dictation = make_dictation()
+    responses = [make_response("Hello"), make_response("Hello there", is_final=True), make_response("And")]
+
+    with patch.object(LiveGoogleDictation, 'stream_with_retries', return_value=iter(responses)):
+        dictation.transcribe_stream(iter([]))
+
+    assert dictation.done_speaking_deadline is None
@@ -1,5 +1,6 @@
 import pytest
 import os
+from unittest.mock import MagicMock, Mock, patch
 from query_dispatch import ChatGPTQueryDispatcher
 from utils import get_config_path
 
@@ -14,3 +15,163 @@ def test_load_git_repo_into_history():
 def test_query_dispatcher_init():
     dispatcher = ChatGPTQueryDispatcher(pre_prompt="Test pre-prompt", config_file_path=get_config_path())
     assert dispatcher.messages == [{"role": "system", "content": "Test pre-prompt"}]
+
+def make_streamed_replies(*replies):
+    """Return a side_effect for chat.completions.create that streams each reply in turn as one chunk."""
+    replies = iter(replies)
+    return lambda **kwargs: iter([Mock(choices=[Mock(delta=Mock(content=next(replies)))])])
+
+
+def ask(dispatcher, prompt):
+    return "".join(dispatcher.sendQueryStreaming(prompt))
+
+
+def test_send_query_streaming_reuses_reply_after_same_conversation(tmp_path):
+    dispatcher = ChatGPTQueryDispatcher(pre_prompt="Test pre-prompt")
+    dispatcher.client = Mock()
+    dispatcher.client.chat.completions.create.side_effect = make_streamed_replies("Hi there!", "Hi there!")
+
+    with patch('query_dispatch.get_tempdir', return_value=str(tmp_path)):
+        replies = [ask(dispatcher, "Hello") for _ in range(2)]
+        dispatcher.messages = dispatcher.messages[:1]  # Start the same conversation over
+        replies += [ask(dispatcher, "Hello") for _ in range(2)]
+
+    assert replies == ["Hi there!"] * len(replies)
+    assert dispatcher.client.chat.completions.create.call_count == 2
+
+
+def test_send_query_streaming_misses_cache_when_earlier_turns_differ(tmp_path):
+    dispatcher = ChatGPTQueryDispatcher(pre_prompt="Test pre-prompt")
+    dispatcher.client = Mock()
+    dispatcher.client.chat.completions.create.side_effect = make_streamed_replies(
+        "Nice to meet you!", "Your name is Alice.", "Nice to meet you!", "Your name is Bob."
+    )
+
+    with patch('query_dispatch.get_tempdir', return_value=str(tmp_path)):
+        ask(dispatcher, "My name is Alice")
+        assert ask(dispatcher, "What is my name?") == "Your name is Alice."
+        dispatcher.messages = dispatcher.messages[:1]
+        ask(dispatcher, "My name is Bob")  # Same previous reply as before, different user turn
+        assert ask(dispatcher, "What is my name?") == "Your name is Bob."
+
+    assert dispatcher.client.chat.completions.create.call_count == 4
+
+
+def test_send_query_streaming_skips_cache_in_long_conversation(tmp_path):
+    dispatcher = ChatGPTQueryDispatcher(pre_prompt="Test pre-prompt")
+    dispatcher.client = Mock()
+    dispatcher.client.chat.completions.create.side_effect = make_streamed_replies("Hi there!", "Hi there!")
+    history = [{"role": "user", "content": "Hello"}, {"role": "assistant", "content": "Hi there!"}]
+    dispatcher.messages += history * (ChatGPTQueryDispatcher.CACHE_MAX_HISTORY_MESSAGES // 2 + 1)
+
+    with patch('query_dispatch.get_tempdir', return_value=str(tmp_path)):
+        ask(dispatcher, "Hello")
+        ask(dispatcher, "Hello")
+
+    assert dispatcher.client.chat.completions.create.call_count == 2
+    assert not dispatcher.response_cache
+
+
+def test_send_query_is_never_cached(tmp_path):
+    dispatcher = ChatGPTQueryDispatcher(pre_prompt="Test pre-prompt")
+    dispatcher.client = Mock()
+    dispatcher.client.chat.completions.create.return_value.choices = [Mock(message=Mock(content="Bad reply"))]
+
+    with patch('query_dispatch.get_tempdir', return_value=str(tmp_path)):
+        for _ in range(3):  # e.g. a TTV retry loop re-sending the same prompt
+            dispatcher.messages = dispatcher.messages[:1]
+            dispatcher.sendQuery("Rewrite this")
+
+    assert dispatcher.client.chat.completions.create.call_count == 3
+    assert not dispatcher.response_cache
+
+
+def test_send_query_streaming_records_full_reply(tmp_path):
+    dispatcher = ChatGPTQueryDispatcher(pre_prompt="Test pre-prompt")
+    dispatcher.client = Mock()
+    dispatcher.client.chat.completions.create.return_value = iter([
+        Mock(choices=[Mock(delta=Mock(content="Hi "))]),
+        Mock(choices=[Mock(delta=Mock(content=None))]),
+        Mock(choices=[Mock(delta=Mock(content="there!"))]),
+        Mock(choices=[]),
+    ])
+
+    with patch('query_dispatch.get_tempdir', return_value=str(tmp_path)):
+        chunks = list(dispatcher.sendQueryStreaming("Hello"))
+
+    assert chunks == ["Hi ", "there!"]
+    assert dispatcher.messages[-1] == {"role": "assistant", "content": "Hi there!"}
+
+
+def test_response_cache_evicts_least_recently_used_and_expired():
+    dispatcher = ChatGPTQueryDispatcher(pre_prompt="Test pre-prompt")
+
+    with patch.object(ChatGPTQueryDispatcher, 'CACHE_MAX_ENTRIES', 2):
+        dispatcher.cache_reply("first", "1")
+        dispatcher.cache_reply("second", "2")
+        assert dispatcher.get_cached_reply("first") == "1"  # "second" is now least recently used
+        dispatcher.cache_reply("third", "3")
+
+    assert dispatcher.get_cached_reply("second") is None
+    assert dispatcher.get_cached_reply("third") == "3"
+
+    with patch('query_dispatch.monotonic', return_value=dispatcher.response_cache["first"][1] + ChatGPTQueryDispatcher.CACHE_TTL_SECONDS + 1):
+        assert dispatcher.get_cached_reply("first") is None
+    assert "first" not in dispatcher.response_cache
+
+
+def test_rotate_session_history_drops_oldest_messages():
+    dispatcher = ChatGPTQueryDispatcher(pre_prompt="Test pre-prompt")
+    long_message = " ".join(["word"] * 3000)
+    dispatcher.messages += [
+        {"role": "user", "content": long_message},
+        {"role": "assistant", "content": long_message},
+        {"role": "user", "content": "Hello"},
+    ]
+
+    dispatcher.rotate_session_history()
+
+    assert dispatcher.messages == [
+        {"role": "assistant", "content": long_message},
+        {"role": "user", "content": "Hello"},
+    ]
+
+
+def test_send_query_streaming_records_partial_reply_when_closed_early(tmp_path):
+    dispatcher = ChatGPTQueryDispatcher(pre_prompt="Test pre-prompt")
+    dispatcher.client = Mock()
+    stream = MagicMock()
+    stream.__iter__.return_value = iter([
+        Mock(choices=[Mock(delta=Mock(content="Hi "))]),
+        Mock(choices=[Mock(delta=Mock(content="there!"))]),
+    ])
+    dispatcher.client.chat.completions.create.return_value = stream
+
+    with patch('query_dispatch.get_tempdir', return_value=str(tmp_path)):
+        chunks = dispatcher.sendQueryStreaming("Hello")
+        assert next(chunks) == "Hi "
+        chunks.close()
+
+    stream.close.assert_called_once_with()
+    assert dispatcher.messages[-2:] == [{"role": "user", "content": "Hello"}, {"role": "assistant", "content": "Hi "}]
+    assert not dispatcher.response_cache
+
+
+def test_send_query_streaming_requeries_once_cached_reply_expires(tmp_path):
+    dispatcher = ChatGPTQueryDispatcher(pre_prompt="Test pre-prompt")
+    dispatcher.client = Mock()
+    dispatcher.client.chat.completions.create.side_effect = make_streamed_replies("Hi there!", "Hi there!")
+    clock = [0.0]
+
+    with patch('query_dispatch.get_tempdir', return_value=str(tmp_path)), \
+         patch('query_dispatch.monotonic', side_effect=lambda: clock[0]):
+        ask(dispatcher, "Hello")
+        dispatcher.messages = dispatcher.messages[:1]
+        ask(dispatcher, "Hello")  # Cached: same input after the same conversation
+        assert dispatcher.client.chat.completions.create.call_count == 1
+
+        clock[0] += ChatGPTQueryDispatcher.CACHE_TTL_SECONDS + 1
+        dispatcher.messages = dispatcher.messages[:1]
+        ask(dispatcher, "Hello")
+
+    assert dispatcher.client.chat.completions.create.call_count == 2
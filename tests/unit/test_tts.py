@@ -0,0 +1,141 @@
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from tts import GoogleTTS, TextToSpeech
+
+
+class FakeTTS(TextToSpeech):
+    def __init__(self):
+        self.played = []
+
+    def convert_text_to_speech(self, text: str, voice_id: str = "en-US-Casual-K", thread_id: str = None):
+        return True, f"{text}.mp3"
+
+    def play_speech_response(self, file_path, raw_response, show_header=True):
+        self.played.append((file_path, raw_response))
+
+
+def test_split_text_keeps_unterminated_tail():
+    assert TextToSpeech.split_text("Hello there. How are you?! I am fine") == ["Hello there.", "How are you?!", "I am fine"]
+
+
+def test_split_text_only_splits_where_whitespace_follows_punctuation():
+    text = "GPT-3.5 costs $0.50 per call, e.g. for www.example.com. Next!"
+
+    assert TextToSpeech.split_text(text) == ["GPT-3.5 costs $0.50 per call, e.g. for www.example.com.", "Next!"]
+
+
+def test_split_text_keeps_abbreviations_and_initials_with_their_sentence():
+    text = "Mr. Smith met Dr. Jones and J. R. Tolkien. They left."
+
+    assert TextToSpeech.split_text(text) == ["Mr. Smith met Dr. Jones and J. R. Tolkien.", "They left."]
+
+
+def test_split_text_breaks_long_sentences_between_words():
+    text = "alpha beta gamma delta epsilon"
+
+    assert TextToSpeech.split_text(text, max_length=12) == ["alpha beta", "gamma delta", "epsilon"]
+
+
+def test_stream_speech_chunks_plays_sentences_in_order():
+    fake_tts = FakeTTS()
+    fake_tts.stream_speech_chunks(["First sentence. Second sentence! Third?"])
+
+    assert fake_tts.played == [
+        ("First sentence..mp3", "First sentence."),
+        ("Second sentence!.mp3", "Second sentence!"),
+        ("Third?.mp3", "Third?"),
+    ]
+
+
+def test_stream_speech_chunks_stops_synthesis_when_playback_fails():
+    class FailingPlaybackTTS(FakeTTS):
+        def play_speech_response(self, file_path, raw_response, show_header=True):
+            raise RuntimeError("playback failed")
+
+    fake_tts = FailingPlaybackTTS()
+    sentences = " ".join(f"Sentence {i}." for i in range(20))
+    threads_before = threading.active_count()
+
+    with pytest.raises(RuntimeError):
+        fake_tts.stream_speech_chunks([sentences])
+
+    assert threading.active_count() == threads_before
+
+
+def test_stream_speech_chunks_skips_sentences_with_recoverable_errors():
+    class FlakyTTS(FakeTTS):
+        def convert_text_to_speech(self, text: str, voice_id: str = "en-US-Casual-K", thread_id: str = None):
+            if text.startswith("Second"):
+                raise ConnectionError("connection reset")
+            return super().convert_text_to_speech(text, voice_id, thread_id)
+
+    fake_tts = FlakyTTS()
+    fake_tts.stream_speech_chunks(["First sentence. Second sentence. Third sentence."])
+
+    assert [sentence for _, sentence in fake_tts.played] == ["First sentence.", "Third sentence."]
+
+
+def test_stream_speech_chunks_raises_unexpected_worker_errors():
+    class BrokenTTS(FakeTTS):
+        def convert_text_to_speech(self, text: str, voice_id: str = "en-US-Casual-K", thread_id: str = None):
+            raise TypeError("bad voice config")
+
+    with pytest.raises(TypeError):
+        BrokenTTS().stream_speech_chunks(["Hello there."])
+
+
+def test_stream_speech_chunks_speaks_sentences_split_across_chunks():
+    fake_tts = FakeTTS()
+    response = fake_tts.stream_speech_chunks(iter(["Hello th", "ere. How are", " you? I am", " fine"]))
+
+    assert response == "Hello there. How are you? I am fine"
+    assert [sentence for _, sentence in fake_tts.played] == ["Hello there.", "How are you?", "I am fine"]
+
+
+def test_stream_speech_chunks_stops_when_user_interrupts_playback():
+    class InterruptedTTS(FakeTTS):
+        def play_speech_response(self, file_path, raw_response, show_header=True):
+            super().play_speech_response(file_path, raw_response)
+            return raw_response.startswith("Second")  # The user presses Enter during the second sentence
+
+    fake_tts = InterruptedTTS()
+    fake_tts.stream_speech_chunks([" ".join(f"{word} sentence." for word in ["First", "Second", "Third", "Fourth"])])
+
+    assert [sentence for _, sentence in fake_tts.played] == ["First sentence.", "Second sentence."]
+
+
+def test_stream_speech_chunks_prints_header_once_per_response(monkeypatch):
+    monkeypatch.setenv('PLAYBACK_MEDIA_IN_TESTS', 'true')
+    fake_tts = FakeTTS()
+
+    with patch('tts.Logger.print_demon_output') as print_demon_output:
+        fake_tts.stream_speech_chunks(["First sentence. Second sentence. Third sentence."])
+
+    headers = [call for call in print_demon_output.call_args_list if "GANGLIA says" in call.args[0]]
+    assert len(headers) == 1
+    assert len(fake_tts.played) == 3
+
+
+def test_stream_speech_chunks_signals_playback_start_before_first_sentence():
+    events = []
+
+    class RecordingTTS(FakeTTS):
+        def play_speech_response(self, file_path, raw_response, show_header=True):
+            events.append(raw_response)
+
+    RecordingTTS().stream_speech_chunks(iter(["First sentence. ", "Second sentence."]), on_playback_start=lambda: events.append("start"))
+
+    assert events == ["start", "First sentence.", "Second sentence."]
+
+
+def test_google_tts_gives_sentences_with_same_opening_words_separate_files(tmp_path):
+    with patch('tts.tts.TextToSpeechClient') as client, patch('tts.get_tempdir', return_value=str(tmp_path)):
+        client.return_value.synthesize_speech.side_effect = lambda **kwargs: Mock(audio_content=kwargs["input"].text.encode())
+        google_tts = GoogleTTS()
+        _, first_path = google_tts.convert_text_to_speech("Happy Halloween to you!")
+        _, second_path = google_tts.convert_text_to_speech("Happy Halloween to all!")
+
+    assert first_path != second_path
+    with open(first_path, "rb") as first_clip:
+        assert first_clip.read() == b"Happy Halloween to you!"
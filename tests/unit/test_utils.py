@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import Mock, patch
-from utils import exponential_backoff
+import json
+import os
+from utils import exponential_backoff, load_json_config
 from logger import Logger
 
 def test_exponential_backoff_success():
@@ -49,4 +51,18 @@ def test_exponential_backoff_with_thread_id():
     # Verify logging includes thread ID
     assert any("test-thread" in str(call) for call in mock_debug.call_args_list)
     assert any("test-thread" in str(call) for call in mock_warning.call_args_list)
-    assert any("test-thread" in str(call) for call in mock_info.call_args_list) 
\ No newline at end of file
+    assert any("test-thread" in str(call) for call in mock_info.call_args_list) 
+
+def test_load_json_config_reuses_parse_until_file_changes(tmp_path):
+    """Test that the parsed config is shared until the file's modification time changes."""
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"conversation": {"hotwords": {"hello": "hi"}}}))
+
+    first = load_json_config(str(config_path))
+    assert load_json_config(str(config_path)) is first
+
+    config_path.write_text(json.dumps({"conversation": {}}))
+    stat = os.stat(config_path)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert load_json_config(str(config_path)) == {"conversation": {}}
@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
 import re
+import queue
 import select
 import sys
 import threading
 import os
+import uuid
 from google.cloud import texttospeech_v1 as tts
 import subprocess
 from urllib.parse import urlparse
@@ -11,7 +13,14 @@ from datetime import datetime
 from logger import Logger
 from utils import get_tempdir, exponential_backoff
 
+# Errors that only cost us one sentence of speech (OSError covers ConnectionError and TimeoutError)
+TTS_RECOVERABLE_ERRORS = (OSError,)
+
 class TextToSpeech(ABC):
+    MAX_BUFFERED_SENTENCES = 4  # How far synthesis may run ahead of playback
+    # Whitespace that follows closing punctuation, except after initials and abbreviations like "e.g." or "Dr."
+    SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])(?<!\b[A-Za-z]\.)(?<!\b(?:Mr|Ms|Dr|St|vs)\.)(?<!\bMrs\.)\s+')
+
     @abstractmethod
     def convert_text_to_speech(self, text: str, voice_id: str = "en-US-Casual-K", thread_id: str = None):
         pass
@@ -25,37 +34,125 @@ class TextToSpeech(ABC):
 
     @classmethod
     def split_text(cls, text: str, max_length: int = 250):
-        sentences = [match.group() for match in re.finditer(r'[^.!?]*[.!?]', text)]
         chunks = []
 
-        for sentence in sentences:
+        for sentence in cls.SENTENCE_BOUNDARY.split(text):
+            sentence = sentence.strip()
             while len(sentence) > max_length:
-                chunk = sentence[:max_length]
-                chunks.append(chunk.strip())
-                sentence = sentence[max_length:]
-            chunks.append(sentence.strip())
-
-        return chunks
-
+                # Break over-long sentences at the last space that fits so words aren't cut in half
+                cut = sentence.rfind(" ", 0, max_length + 1)
+                if cut <= 0:
+                    cut = max_length
+                chunks.append(sentence[:cut].strip())
+                sentence = sentence[cut:].strip()
+            chunks.append(sentence)
+
+        return [chunk for chunk in chunks if chunk]
+
+    def stream_speech_chunks(self, text_chunks, on_playback_start=None):
+        """
+        Speak a response that may still be arriving (e.g. streamed from the LLM) and return its full text.
+
+        on_playback_start, if given, is called once just before the first sentence plays (or when the response
+        turns out to have nothing to play), so callers can cue the listener without waiting for the whole reply.
+
+        A background worker assembles complete sentences from the incoming chunks and converts them to
+        speech into a bounded queue that playback drains, so speech starts with the first sentence and
+        synthesis never runs more than MAX_BUFFERED_SENTENCES ahead of what has been heard.
+        """
+        audio_queue = queue.Queue(maxsize=self.MAX_BUFFERED_SENTENCES)
+        stop_synthesis = threading.Event()
+        response_parts = []
+
+        def synthesize(text):
+            for sentence in self.split_text(text):
+                if stop_synthesis.is_set():
+                    return
+                try:
+                    _, file_path = self.convert_text_to_speech(sentence)
+                except TTS_RECOVERABLE_ERRORS as e:
+                    Logger.print_error("Skipping sentence after text-to-speech error:", e)
+                    file_path = None
+                audio_queue.put((sentence, file_path))
+
+        def generate_tts_worker():
+            pending_text = ""
+            try:
+                for text_chunk in text_chunks:
+                    if stop_synthesis.is_set():
+                        break
+                    response_parts.append(text_chunk)
+                    pending_text += text_chunk
+
+                    # Everything before the last sentence boundary is complete; the tail may still be growing
+                    *complete_text, pending_text = self.SENTENCE_BOUNDARY.split(pending_text)
+                    for text in complete_text:
+                        synthesize(text)
+
+                synthesize(pending_text)
+            except Exception as e:
+                # Hand anything unexpected to the playback side so it surfaces instead of hanging the turn
+                audio_queue.put(e)
+            finally:
+                audio_queue.put(None)  # Signal the end of the response
+
+        tts_thread = threading.Thread(target=generate_tts_worker)
+        tts_thread.daemon = True  # Ensure the thread exits when the main program exits
+        tts_thread.start()
 
+        try:
+            first_clip = True
+            while (item := audio_queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                sentence, file_path = item
+                if file_path:
+                    if first_clip:
+                        first_clip = False
+                        if on_playback_start:
+                            on_playback_start()
+                        if self.playback_enabled():
+                            Logger.print_demon_output("\nGANGLIA says...")
+                    if self.play_speech_response(file_path, sentence, show_header=False):
+                        break  # The user stopped playback, which ends the whole response
+
+            if first_clip and on_playback_start:
+                on_playback_start()
+        finally:
+            # If playback stopped early, tell the worker to quit and drain the queue so it is not left blocked on put
+            stop_synthesis.set()
+            while tts_thread.is_alive():
+                try:
+                    audio_queue.get(timeout=0.1)
+                except queue.Empty:
+                    pass
+
+        return "".join(response_parts)
+
+    @staticmethod
+    def playback_enabled():
+        # Only play audio if explicitly enabled
+        return os.getenv('PLAYBACK_MEDIA_IN_TESTS', 'false').lower() == 'true'
 
-    def play_speech_response(self, file_path, raw_response):
+    def play_speech_response(self, file_path, raw_response, show_header=True):
+        """Play an audio file and print its text. Returns True if the user stopped playback with Enter."""
         if file_path.endswith('.txt'):
             file_path = self.concatenate_audio_from_text(file_path)
 
-        # Only play audio if explicitly enabled
-        if os.getenv('PLAYBACK_MEDIA_IN_TESTS', 'false').lower() == 'true':
+        if self.playback_enabled():
             # Prepare the play command and determine the audio duration
             play_command, audio_duration = self.prepare_playback(file_path)
 
-            Logger.print_demon_output(f"\nGANGLIA says... (Audio Duration: {audio_duration:.1f} seconds)")
+            if show_header:
+                Logger.print_demon_output(f"\nGANGLIA says... (Audio Duration: {audio_duration:.1f} seconds)")
             Logger.print_demon_output(raw_response)
 
             # Start playback in a non-blocking manner
             playback_process = subprocess.Popen(play_command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, stdin=subprocess.DEVNULL)
 
             # Start the Enter key listener in a separate thread
-            stop_thread = threading.Thread(target=self.monitor_enter_keypress, args=(playback_process,))
+            stopped_by_user = threading.Event()
+            stop_thread = threading.Thread(target=self.monitor_enter_keypress, args=(playback_process, stopped_by_user))
             stop_thread.daemon = True  # Ensure the thread exits when the main program exits
             stop_thread.start()
 
@@ -65,7 +162,11 @@ class TextToSpeech(ABC):
             # Ensure Enter key thread finishes
             stop_thread.join(timeout=1)  # Attempt to join, but timeout if it hangs
 
-    def monitor_enter_keypress(self, playback_process):
+            return stopped_by_user.is_set()
+
+        return False
+
+    def monitor_enter_keypress(self, playback_process, stopped_by_user):
         """Non-blocking Enter key listener."""
         Logger.print_debug("Press Enter to stop playback...")
 
@@ -75,6 +176,7 @@ class TextToSpeech(ABC):
                 key_press = sys.stdin.read(1)  # Read single character
                 if key_press == '\n':  # Check for Enter key
                     Logger.print_debug("Enter key detected. Terminating playback...")
+                    stopped_by_user.set()
                     playback_process.terminate()  # Terminate the playback if Enter is pressed
                     break
 
@@ -145,7 +247,8 @@ class GoogleTTS(TextToSpeech):
         snippet = '_'.join(sanitized_words)
 
         # Save the audio to a file
-        file_path = os.path.join(temp_dir, "tts", f"chatgpt_response_{snippet}_{datetime.now().strftime('%Y%m%d-%H%M%S')}.mp3")
+        # The uuid keeps sentences synthesized in the same second from overwriting a clip still queued for playback
+        file_path = os.path.join(temp_dir, "tts", f"chatgpt_response_{snippet}_{datetime.now().strftime('%Y%m%d-%H%M%S')}_{uuid.uuid4().hex[:8]}.mp3")
         with open(file_path, "wb") as out:
             out.write(response.audio_content)
 
@@ -11,6 +11,7 @@ import os
 import subprocess
 import time
 import threading
+import traceback
 
 # Add parent directory to Python path to import logger
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -227,6 +228,5 @@ def create_word_level_captions(audio_path: str, text: str = "", is_music: bool =
         return captions
     except Exception as e:
         Logger.print_error(f"Error in create_word_level_captions: {str(e)}")
-        import traceback
         Logger.print_error(f"Traceback: {traceback.format_exc()}")
         return [] 
\ No newline at end of file
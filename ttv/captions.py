@@ -2,6 +2,7 @@
 
 from typing import List, Tuple, Optional
 import tempfile
+import traceback
 from dataclasses import dataclass
 from logger import Logger
 from .caption_roi import find_roi_in_frame, get_contrasting_color
@@ -508,7 +509,6 @@ def create_dynamic_captions(
 
     except Exception as e:
         Logger.print_error(f"Error adding dynamic captions: {str(e)}")
-        import traceback
         Logger.print_error(f"Traceback: {traceback.format_exc()}")
         return None
     finally:
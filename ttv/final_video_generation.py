@@ -12,6 +12,7 @@ from .audio_alignment import create_word_level_captions
 from .captions import create_dynamic_captions, create_static_captions, CaptionEntry
 from .log_messages import LOG_CLOSING_CREDITS_DURATION
 import json
+import traceback
 from datetime import datetime
 
 def _get_timestamped_filename(base_name: str) -> str:
@@ -122,7 +123,6 @@ def concatenate_video_segments(video_segments, output_path):
             
     except Exception as e:
         Logger.print_error(f"Error during video concatenation: {str(e)}")
-        import traceback
         Logger.print_error(f"Traceback: {traceback.format_exc()}")
         return None
 
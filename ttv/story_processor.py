@@ -2,6 +2,7 @@ import concurrent.futures
 import time
 import os
 import json
+import traceback
 from logger import Logger
 from music_lib import MusicGenerator
 from .image_generation import generate_image, generate_blank_image, save_image_without_caption
@@ -186,8 +187,8 @@ def process_story(tts, style, story, skip_generation, query_dispatcher, story_ti
         background_music_path = None
         background_music_future = None
         if config and config.background_music:
-            file_path = getattr(config.background_music, 'file', '')
-            prompt = getattr(config.background_music, 'prompt', '')
+            file_path = config.background_music.file
+            prompt = config.background_music.prompt
             if file_path:
                 background_music_path = file_path
                 Logger.print_info(f"Using file-based background music: {background_music_path}")
@@ -205,9 +206,9 @@ def process_story(tts, style, story, skip_generation, query_dispatcher, story_ti
         closing_credits_path = None
         closing_credits_future = None
         closing_credits_lyrics = None
-        if config and hasattr(config, 'closing_credits') and config.closing_credits:
-            file_path = getattr(config.closing_credits, 'file', None)
-            prompt = getattr(config.closing_credits, 'prompt', None)
+        if config and config.closing_credits:
+            file_path = config.closing_credits.file
+            prompt = config.closing_credits.prompt
             if file_path:
                 closing_credits_path = file_path
                 Logger.print_info(f"Using file-based closing credits music: {closing_credits_path}")
@@ -282,7 +283,6 @@ def process_story(tts, style, story, skip_generation, query_dispatcher, story_ti
                 
             except Exception as e:
                 Logger.print_error(f"Error processing segment {i}: {str(e)}")
-                import traceback
                 Logger.print_error(f"Traceback for segment {i}: {traceback.format_exc()}")
                 failed_segments.append(i)
 
@@ -351,7 +351,6 @@ def process_story(tts, style, story, skip_generation, query_dispatcher, story_ti
                     Logger.print_error("Movie poster generation returned None")
             except Exception as e:
                 Logger.print_error(f"Error generating movie poster: {str(e)}")
-                import traceback
                 Logger.print_error(f"Traceback: {traceback.format_exc()}")
 
     return video_segments, background_music_path, closing_credits_path, movie_poster_path, closing_credits_lyrics
@@ -2,6 +2,7 @@ from .config_loader import load_input
 from .story_processor import process_story
 from .final_video_generation import assemble_final_video
 from tts import GoogleTTS
+import traceback
 from logger import Logger
 
 def text_to_video(config_path, skip_generation=False, output_path=None, tts=None, query_dispatcher=None):
@@ -44,6 +45,5 @@ def text_to_video(config_path, skip_generation=False, output_path=None, tts=None
 
     except Exception as e:
         Logger.print_error(f"Error in text_to_video: {str(e)}")
-        import traceback
         Logger.print_error(f"Traceback: {traceback.format_exc()}")
         return None
@@ -4,6 +4,7 @@ from .ffmpeg_wrapper import run_ffmpeg_command
 from utils import get_tempdir
 from ttv.log_messages import LOG_VIDEO_SEGMENT_CREATE
 import os
+import traceback
 import uuid
 
 def create_video_segment(image_path, audio_path, output_path=None):
@@ -51,7 +52,6 @@ def create_video_segment(image_path, audio_path, output_path=None):
             return None
     except Exception as e:
         Logger.print_error(f"Error creating video segment: {str(e)}")
-        import traceback
         Logger.print_error(f"Traceback: {traceback.format_exc()}")
         return None
 
@@ -1,4 +1,5 @@
 import os
+import json
 import openai
 from datetime import datetime
 import tempfile
@@ -32,6 +33,27 @@ def get_config_path():
     """Get the path to the config directory relative to the project root."""
     return os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'ganglia_config.json')
 
+_json_config_cache = {}  # absolute path -> (modification time, parsed config)
+
+def load_json_config(config_file_path):
+    """
+    Load a JSON config file, reusing the parsed result until the file changes on disk.
+
+    Several components read ganglia_config.json at startup, so this parses it once for all of them.
+    The returned dict is shared between callers and must not be modified.
+    Raises FileNotFoundError or json.JSONDecodeError just as opening and parsing the file would.
+    """
+    path = os.path.abspath(config_file_path)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _json_config_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with open(path, 'r') as json_file:
+        config = json.load(json_file)
+    _json_config_cache[path] = (mtime, config)
+    return config
+
 @lru_cache(maxsize=1)
 def get_system_info():
     """